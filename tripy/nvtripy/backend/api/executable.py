@@ -14,22 +14,25 @@
 # limitations under the License.
 import base64
 import inspect
-from dataclasses import dataclass
-from typing import Sequence, Tuple, Union
+import os
+from itertools import islice
+from typing import Dict, NamedTuple, Sequence, Tuple, Union
 
 import mlir_tensorrt.runtime.api as runtime
-from nvtripy import export
+from nvtripy import export, utils
 from nvtripy.backend.mlir import Executor
 from nvtripy.backend.mlir import utils as mlir_utils
 from nvtripy.common.exception import raise_error
 from nvtripy.frontend import Tensor
+from nvtripy.trace.ops.storage import Storage
 from nvtripy.utils import json as json_utils
 from nvtripy.utils.types import str_from_type_annotation
 
 
 # TODO(MLIR-TRT #923): Can generalize `InputInfo` and drop this class.
-@dataclass
-class ArgInfo:
+# This is a `NamedTuple` rather than a dataclass so that instances are lightweight and immutable
+# (`dataclass(slots=True)` requires Python 3.10).
+class ArgInfo(NamedTuple):
     shape_bounds: Sequence[Tuple[int, int]]
     """A sequence of tuple(min, max) indicating the bounds of each dimension"""
     dtype: "nvtripy.dtype"
@@ -55,12 +58,22 @@ class Executable:
         self._output_devices = output_devices
         self._executable_signature = self._executable.get_signature("main")
 
+        # Query the signature once up front so we don't need to cross into the runtime on every call.
+        num_input_args = self._executable_signature.get_num_input_args()
+        num_output_args = self._executable_signature.get_num_output_args()
+        self._all_arg_info = tuple(self._compute_arg_info(idx) for idx in range(num_input_args + num_output_args))
+        self._input_info = self._all_arg_info[:num_input_args]
+        self._output_info = self._all_arg_info[num_input_args:]
+        self._expected_input_dtypes = tuple(info.dtype for info in self._input_info)
+        self._expected_input_shape_bounds = tuple(info.shape_bounds for info in self._input_info)
+
         # Build a signature so the executable works with `inspect.signature`
         params = []
         for name in self._arg_names:
             params.append(inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Tensor))
 
-        return_annotation = Tensor if self._executable_signature.get_num_output_args() == 1 else Sequence[Tensor]
+        self._single_output = num_output_args == 1
+        return_annotation = Tensor if self._single_output else Sequence[Tensor]
 
         self.__signature__ = inspect.Signature(params, return_annotation=return_annotation)
 
@@ -118,7 +131,19 @@ class Executable:
             loaded_executable = tp.Executable.load(executable_file)
         """
 
-        return json_utils.load(path)
+        executable = json_utils.load(path)
+        if isinstance(executable, Executable):
+            # Older versions of Tripy embedded the serialized executable in the JSON file.
+            return executable
+
+        executable_bytes = utils.utils.load_file(
+            os.path.join(os.path.dirname(path), executable["executable_path"]), mode="rb"
+        )
+        return Executable(
+            runtime.Executable(executable_bytes),
+            executable["arg_names"],
+            executable["output_devices"],
+        )
 
     def __call__(self, *args: Tensor, **kwargs: Tensor) -> Union[Tensor, Sequence[Tensor]]:
         """
@@ -152,22 +177,46 @@ class Executable:
 
             out = compiled_add(a, b)
         """
-        num_positional = len(args)
-        NUM_ARGS = num_positional + len(kwargs)
-
         input_tensors = list(args)
-        # Need to get arguments in the order of self._arg_names, which may be different from kwargs ordering.
+        # Positional-only calls are the common case, so we only need to look at kwargs if any were provided.
+        if kwargs:
+            # Need to get arguments in the order of self._arg_names, which may be different from kwargs ordering.
+            # We use `islice` to walk the remaining names without copying them into a new list on every call.
+            input_tensors.extend(kwargs[name] for name in islice(self._arg_names, len(args), None) if name in kwargs)
+
+        # If every expected argument was provided exactly once, we can skip the detailed argument checks,
+        # which are only needed to emit a helpful error message.
+        if len(input_tensors) != self._num_expected_args or len(input_tensors) != len(args) + len(kwargs):
+            self._raise_argument_error(len(args), kwargs)
+
+        # The executor expects concrete tensors as inputs, so we need to eval() here.
+        # Tensors which are already backed by `Storage` do not need to be evaluated again.
+        input_trace_tensors = []
+        for tensor in input_tensors:
+            if not isinstance(tensor.trace_tensor.producer, Storage):
+                tensor.eval()
+            input_trace_tensors.append(tensor.trace_tensor)
+
+        try:
+            executor_outputs = self._executor.execute(self._output_devices, inputs=input_trace_tensors)
+        except runtime.MTRTException as err:
+            self._handle_execute_error(err, input_tensors)
+            raise
+
+        if self._single_output:
+            return Tensor.fast_init(executor_outputs[0])
+        return [Tensor.fast_init(output) for output in executor_outputs]
+
+    def _raise_argument_error(self, num_positional: int, kwargs: Dict[str, Tensor]) -> None:
         expected_kwargs = self._arg_names[num_positional:]
         for name in expected_kwargs:
             if name not in kwargs:
                 raise_error(f"Missing argument: {name}", [f"Expected the following arguments: {self._arg_names}"])
 
-            input_tensors.append(kwargs[name])
-            del kwargs[name]
-
-        if kwargs:
+        extra_kwargs = [name for name in kwargs if name not in expected_kwargs]
+        if extra_kwargs:
             raise_error(
-                f"Extra keyword arguments: {list(kwargs.keys())}",
+                f"Extra keyword arguments: {extra_kwargs}",
                 [
                     f"Expected the following arguments: {self._arg_names}.\n"
                     f"Note: The following arguments were already provided as positional arguments: {self._arg_names[:num_positional]}"
@@ -175,66 +224,66 @@ class Executable:
             )
 
         # We do this after kwarg checks since those will be more informative (we can explain which arguments are missing/extra).
+        raise_error(
+            "Incorrect number of arguments.",
+            [
+                f"Expected {self._num_expected_args} arguments but got {num_positional + len(kwargs)}.\n"
+                f"Note: Expected arguments were: {self._arg_names}",
+            ],
+        )
+
+    def _handle_execute_error(self, err: runtime.MTRTException, input_tensors: Sequence[Tensor]) -> None:
+        # Kept out of `__call__` so the error handling logic doesn't weigh down the hot path.
+        # If we cannot provide a more helpful error message, this returns and the caller re-raises the original error.
+        # TODO: Evaluate whether this should be moved into the executor
+        msg = str(err)
+        handler = next((handler for pattern, handler in _EXECUTE_ERROR_HANDLERS if pattern in msg), None)
+        if handler is not None:
+            handler(self, msg, input_tensors)
+
+    def _raise_dtype_error(self, msg: str, input_tensors: Sequence[Tensor]) -> None:
+        # If the problem is a mismatched data type, we can provide a better error message than the executor can.
+        for tensor, dtype, arg_name in zip(input_tensors, self._expected_input_dtypes, self._arg_names):
+            if tensor.dtype != dtype:
+                raise_error(
+                    f"Unexpected tensor data type.",
+                    [
+                        f"For parameter {arg_name}, expected data type: {dtype} but got: {tensor.dtype}. Note: Argument was: ",
+                        tensor,
+                    ],
+                )
+
+    def _raise_shape_error(self, msg: str, input_tensors: Sequence[Tensor]) -> None:
+        for tensor, expected_bounds, arg_name in zip(input_tensors, self._expected_input_shape_bounds, self._arg_names):
+            shape = tensor.shape
+            # Find the first dimension (if any) which falls outside of the expected bounds.
+            i = next(
+                (
+                    i
+                    for i, (dim, (min_dim, max_dim)) in enumerate(zip(shape, expected_bounds))
+                    if not min_dim <= dim <= max_dim
+                ),
+                None,
+            )
+            if i is None:
+                continue
 
-        if NUM_ARGS != self._num_expected_args:
+            min_shape, max_shape = zip(*expected_bounds)
             raise_error(
-                "Incorrect number of arguments.",
+                f"Unexpected tensor shape.",
                 [
-                    f"Expected {self._num_expected_args} arguments but got {NUM_ARGS}.\n"
-                    f"Note: Expected arguments were: {self._arg_names}",
+                    f"For tensor: `{arg_name}`, expected a shape within the bounds: min={min_shape}, max={max_shape}, but got: {shape}.\n"
+                    f"Dimension {i} has a shape of {shape[i]}, which is not within the expected bounds of {list(expected_bounds[i])}.\n"
+                    f"Note: The provided argument was: ",
+                    tensor,
                 ],
             )
 
-        # The executor expects concrete tensors as inputs, so we need to eval() here.
-        for tensor in input_tensors:
-            tensor.eval()
+    def _raise_stride_error(self, msg: str, input_tensors: Sequence[Tensor]) -> None:
+        # Just raise the error for now.
+        raise_error(msg)
 
-        try:
-            executor_outputs = self._executor.execute(
-                self._output_devices, inputs=[tensor.trace_tensor for tensor in input_tensors]
-            )
-        except runtime.MTRTException as err:
-            # TODO: Evaluate whether this should be moved into the executor
-            if "function expects a memref type with element type" in str(err):
-                # If the problem is a mismatched data type, we can provide a better error message than the executor can.
-                expected_input_dtypes = [info.dtype for info in self._get_input_info()]
-                for tensor, dtype, arg_name in zip(input_tensors, expected_input_dtypes, self._arg_names):
-                    if tensor.dtype != dtype:
-                        raise_error(
-                            f"Unexpected tensor data type.",
-                            [
-                                f"For parameter {arg_name}, expected data type: {dtype} but got: {tensor.dtype}. Note: Argument was: ",
-                                tensor,
-                            ],
-                        )
-            elif "InternalError: failed to set input shape" in str(err) or "Runtime shape mismatch" in str(err):
-                expected_input_shapes = [info.shape_bounds for info in self._get_input_info()]
-                for tensor, expected_bounds, arg_name in zip(input_tensors, expected_input_shapes, self._arg_names):
-                    shape = tensor.shape
-                    for i in range(len(shape)):
-                        if shape[i] < expected_bounds[i][0] or shape[i] > expected_bounds[i][1]:
-                            min_shape, max_shape = zip(*expected_bounds)
-                            raise_error(
-                                f"Unexpected tensor shape.",
-                                [
-                                    f"For tensor: `{arg_name}`, expected a shape within the bounds: min={min_shape}, max={max_shape}, but got: {shape}.\n"
-                                    f"Dimension {i} has a shape of {shape[i]}, which is not within the expected bounds of {list(expected_bounds[i])}.\n"
-                                    f"Note: The provided argument was: ",
-                                    tensor,
-                                ],
-                            )
-            elif "Runtime stride mismatch" in str(err):
-                # Just raise the error for now.
-                raise raise_error(str(err))
-
-            raise
-
-        output_tensors = [Tensor.fast_init(output) for output in executor_outputs]
-        if len(output_tensors) == 1:
-            output_tensors = output_tensors[0]
-        return output_tensors
-
-    def _get_arg_info(self, idx):
+    def _compute_arg_info(self, idx):
         arg = self._executable_signature.get_arg(idx)
         arg = runtime.MemRefType(arg)
         arg_bound = self._executable_signature.get_arg_bound(idx)
@@ -244,22 +293,20 @@ class Executable:
             shape_bounds = tuple((x, x) for x in arg.shape)
         return ArgInfo(shape_bounds, mlir_utils.convert_runtime_dtype_to_tripy_dtype(arg.dtype))
 
+    def _get_arg_info(self, idx) -> ArgInfo:
+        return self._all_arg_info[idx]
+
     def _get_input_info(self) -> Sequence[ArgInfo]:
-        input_info = []
-        for idx in range(self._executable_signature.get_num_input_args()):
-            input_info.append(self._get_arg_info(idx))
-        return input_info
+        return self._input_info
 
     def _get_output_info(self) -> Sequence[ArgInfo]:
-        output_info = []
-        offset = self._executable_signature.get_num_input_args()
-        for idx in range(self._executable_signature.get_num_output_args()):
-            output_info.append(self._get_arg_info(idx + offset))
-        return output_info
+        return self._output_info
 
     def save(self, path: str) -> None:
         """
         Saves this executable to the provided path.
+        The serialized executable is written in binary form to a separate file
+        alongside it, whose path is ``path`` with a ``.engine`` suffix appended.
 
         Args:
             path: The path at which to save the executable.
@@ -289,7 +336,27 @@ class Executable:
             compiled_add.save(executable_file)
             assert os.path.exists(executable_file)
         """
-        json_utils.save(self, path)
+        # The serialized executable may be very large, so we write it to a separate binary file
+        # rather than base64-encoding it into the JSON.
+        executable_path = f"{path}.engine"
+        utils.utils.save_file(self._executable.serialize(), executable_path, mode="wb")
+        json_utils.save(
+            {
+                "arg_names": self._arg_names,
+                "output_devices": self._output_devices,
+                "executable_path": os.path.basename(executable_path),
+            },
+            path,
+        )
+
+
+# Maps substrings of runtime error messages to the `Executable` methods that can emit more helpful errors for them.
+_EXECUTE_ERROR_HANDLERS = (
+    ("function expects a memref type with element type", Executable._raise_dtype_error),
+    ("InternalError: failed to set input shape", Executable._raise_shape_error),
+    ("Runtime shape mismatch", Executable._raise_shape_error),
+    ("Runtime stride mismatch", Executable._raise_stride_error),
+)
 
 
 @json_utils.Encoder.register(Executable)
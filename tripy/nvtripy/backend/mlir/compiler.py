@@ -15,9 +15,13 @@
 # limitations under the License.
 #
 
-from typing import Optional, Tuple
+import functools
+import hashlib
+import os
+from typing import List, Optional, Tuple
 
 import mlir_tensorrt.compiler.api as compiler
+import mlir_tensorrt.runtime.api as runtime
 from mlir_tensorrt.compiler import ir
 
 import nvtripy.config as cfg
@@ -48,12 +52,73 @@ def _get_compiler_objects() -> Tuple[ir.Context, compiler.CompilerClient]:
     return ctx, G_COMPILER_CLIENT
 
 
+# Returns the compute capability of the device executables are compiled for, or None if it could not be determined.
+# The result (including failure) is cached since it cannot change within a process.
+@functools.lru_cache(maxsize=None)
+def _get_compute_capability() -> Optional[str]:
+    import ctypes
+
+    # Device attributes from the CUDA driver API.
+    CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR = 75
+    CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR = 76
+
+    try:
+        # TODO (#191): Make this work on Windows too
+        cuda = ctypes.CDLL("libcuda.so.1")
+    except OSError:
+        return None
+
+    # Executables are always compiled for the first device (see `Executor`).
+    device = ctypes.c_int()
+    major, minor = ctypes.c_int(), ctypes.c_int()
+    if (
+        cuda.cuInit(0)
+        or cuda.cuDeviceGet(ctypes.byref(device), 0)
+        or cuda.cuDeviceGetAttribute(ctypes.byref(major), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MAJOR, device)
+        or cuda.cuDeviceGetAttribute(ctypes.byref(minor), CU_DEVICE_ATTRIBUTE_COMPUTE_CAPABILITY_MINOR, device)
+    ):
+        return None
+    return f"sm_{major.value}{minor.value}"
+
+
+@utils.utils.call_once
+def _warn_unknown_compute_capability():
+    logger.warning("Could not determine the compute capability of the device; executables will not be cached.")
+
+
+# Returns the path at which to cache the executable for the provided module, or None if it should not be cached.
+def _get_executable_cache_path(mlir_module: ir.Module, opts: List[str]) -> Optional[str]:
+    import tensorrt
+
+    from nvtripy import __version__
+
+    # Serialized executables contain TensorRT engines, which are only valid for the TensorRT version
+    # and GPU architecture they were built with.
+    compute_capability = _get_compute_capability()
+    if compute_capability is None:
+        _warn_unknown_compute_capability()
+        return None
+
+    with mlir_module.context:
+        # The symbol name of the module is generated from a global counter, so we need to omit it
+        # from the key to allow identical programs to share a cache entry.
+        module_op = mlir_module.operation.clone()
+        del module_op.attributes["sym_name"]
+        asm = module_op.get_asm()
+
+    key = hashlib.sha256()
+    for item in [__version__, tensorrt.__version__, compute_capability, *opts, asm]:
+        key.update(item.encode())
+        key.update(b"\0")
+    return os.path.join(config.executable_cache_dir_path, f"{key.hexdigest()}.engine")
+
+
 class Compiler:
     def __init__(self, trt_builder_opt_level=0) -> None:
         self.mlir_context, self.compiler_client = _get_compiler_objects()
         self.trt_builder_opt_level = trt_builder_opt_level
 
-    def _make_mlir_opts(self, trt_builder_opt_level):
+    def _get_mlir_opt_strs(self, trt_builder_opt_level) -> List[str]:
         opts = [
             f"--tensorrt-timing-cache-path={G_TIMING_CACHE_FILE}",
             f"--tensorrt-builder-opt-level={trt_builder_opt_level}",
@@ -67,7 +132,12 @@ class Compiler:
             if config.enable_tensorrt_debug:
                 opts.append(f"--tensorrt-layer-info-dir={config.tensorrt_debug_path}")
                 opts.append(f"--tensorrt-engines-dir={config.tensorrt_debug_path}")
-        return compiler.StableHLOToExecutableOptions(self.compiler_client, opts)
+        return opts
+
+    def _make_mlir_opts(self, trt_builder_opt_level):
+        return compiler.StableHLOToExecutableOptions(
+            self.compiler_client, self._get_mlir_opt_strs(trt_builder_opt_level)
+        )
 
     def compile_stabehlo_program(self, code: str) -> compiler.Executable:
         with self.mlir_context:
@@ -79,7 +149,20 @@ class Compiler:
     @utils.utils.log_time
     def compile(self, mlir_module: ir.Module, flat_ir: Optional["FlatIR"] = None) -> compiler.Executable:
         logger.mlir(lambda: f"{mlir_module.operation.get_asm(large_elements_limit=32)}\n")
-        opts = self._make_mlir_opts(self.trt_builder_opt_level)
+        opt_strs = self._get_mlir_opt_strs(self.trt_builder_opt_level)
+
+        cache_path = None
+        if config.use_executable_disk_cache:
+            cache_path = _get_executable_cache_path(mlir_module, opt_strs)
+            if cache_path is not None and os.path.exists(cache_path):
+                logger.verbose(f"Loading cached executable from: {cache_path}")
+                try:
+                    return runtime.Executable(utils.utils.load_file(cache_path, mode="rb"))
+                except Exception as exc:
+                    # The cached executable will be overwritten once we recompile below.
+                    logger.warning(f"Failed to load cached executable from: {cache_path}. Recompiling.\nNote: {exc}")
+
+        opts = compiler.StableHLOToExecutableOptions(self.compiler_client, opt_strs)
 
         try:
             with redirect_stderr() as outfile:
@@ -92,4 +175,9 @@ class Compiler:
             stderr = outfile.read()
             map_error_to_user_code_and_raise(flat_ir, exc, stderr.decode())
         else:
+            if cache_path is not None:
+                # Write to a temporary file first so that other processes never observe a partially written executable.
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                utils.utils.save_file(executable.serialize(), tmp_path, mode="wb")
+                os.replace(tmp_path, cache_path)
             return executable
@@ -16,7 +16,6 @@
 #
 
 import contextlib
-import numbers
 import os
 import re
 import sys
@@ -88,19 +87,21 @@ def get_mlir_scalar_attr(mlir_dtype, value):
     return attr_func(mlir_dtype, value)
 
 
-def list_to_dense_attr(data: List, mlir_dtype):
+def flatten_constant_data(data) -> List:
+    """
+    Flattens a (possibly nested) constant into a flat list of Python scalars.
+    """
     from nvtripy.frontend.dimension_size import DimensionSize
 
-    if isinstance(data, numbers.Number):
-        return [get_mlir_scalar_attr(mlir_dtype, data)]
+    flat_data = [data]
+    # Constants are rectangular, so we can flatten one level of nesting at a time instead of recursing.
+    while flat_data and isinstance(flat_data[0], (list, tuple)):
+        flat_data = list(chain.from_iterable(flat_data))
+    return [elem.tolist() if isinstance(elem, DimensionSize) else elem for elem in flat_data]
 
-    if isinstance(data, DimensionSize):
-        return [get_mlir_scalar_attr(mlir_dtype, data.tolist())]
 
-    attrs = []
-    for element in data:
-        attrs.extend(list_to_dense_attr(element, mlir_dtype))
-    return attrs
+def list_to_dense_attr(data: List, mlir_dtype):
+    return [get_mlir_scalar_attr(mlir_dtype, element) for element in flatten_constant_data(data)]
 
 
 def make_mlir_tensor(
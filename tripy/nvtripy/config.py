@@ -58,6 +58,41 @@ timing_cache_file_path: str = export.public_api(
 )(os.path.join(tempfile.gettempdir(), "nvtripy-cache"))
 """Path to a timing cache file that can be used to speed up compilation time."""
 
+use_executable_disk_cache: bool = export.public_api(
+    document_under="config.rst",
+    module=sys.modules[__name__],
+    symbol="use_executable_disk_cache",
+)(os.environ.get("TRIPY_USE_EXECUTABLE_DISK_CACHE", "0") == "1")
+"""
+Whether to cache compiled executables on disk so that compiling the same program
+again, even in a different process, can skip compilation entirely.
+Executables are keyed by the MLIR program, the compiler options, the versions of Tripy and TensorRT,
+and the compute capability of the GPU. If the compute capability cannot be determined, executables are not cached.
+
+This can also be enabled/disabled by setting the ``TRIPY_USE_EXECUTABLE_DISK_CACHE``
+environment variable to ``1``/``0`` respectively.
+"""
+
+executable_cache_dir_path: str = export.public_api(
+    document_under="config.rst",
+    autodoc_options=[":no-value:"],
+    module=sys.modules[__name__],
+    symbol="executable_cache_dir_path",
+)(os.path.join(tempfile.gettempdir(), "nvtripy-executable-cache"))
+"""Path to the directory in which executables are cached when :attr:`use_executable_disk_cache` is enabled."""
+
+use_fast_tanh: bool = export.public_api(
+    document_under="config.rst",
+    module=sys.modules[__name__],
+    symbol="use_fast_tanh",
+)(os.environ.get("TRIPY_USE_FAST_TANH", "0") == "1")
+"""
+Whether :func:`nvtripy.tanh` should use a faster rational approximation for ``float32`` inputs.
+The approximation has an absolute error of about ``1e-4``, which is acceptable for many inference workloads.
+
+This can also be enabled/disabled by setting the ``TRIPY_USE_FAST_TANH`` environment variable to ``1``/``0`` respectively.
+"""
+
 enable_dtype_checking: bool = export.public_api(
     document_under="config.rst",
     module=sys.modules[__name__],
@@ -323,6 +323,7 @@ class FlatIR:
                 return module
 
         from nvtripy.backend.mlir.utils import redirect_stderr
+        from nvtripy.flat_ir.ops.constant import release_host_staging_buffers
 
         try:
             with redirect_stderr() as outfile:
@@ -335,6 +336,8 @@ class FlatIR:
             stderr = outfile.read()
 
             map_error_to_user_code_and_raise(self, exc, stderr.decode())
+        finally:
+            release_host_staging_buffers()
 
         return mlir
 
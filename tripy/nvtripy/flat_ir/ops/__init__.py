@@ -30,12 +30,14 @@ from nvtripy.flat_ir.ops.cos import CosineOp
 from nvtripy.flat_ir.ops.divide import DivideOp
 from nvtripy.flat_ir.ops.dot import DotOp
 from nvtripy.flat_ir.ops.exponential import ExpOp
+from nvtripy.flat_ir.ops.expm1 import Expm1Op
 from nvtripy.flat_ir.ops.flip import FlipOp
 from nvtripy.flat_ir.ops.floor import FloorOp
 from nvtripy.flat_ir.ops.gather import DynamicGatherOp
 from nvtripy.flat_ir.ops.get_dimension_size import GetDimensionSizeOp
 from nvtripy.flat_ir.ops.iota import DynamicIotaOp
 from nvtripy.flat_ir.ops.log import LogOp
+from nvtripy.flat_ir.ops.log1p import Log1pOp
 from nvtripy.flat_ir.ops.maximum import MaxOp
 from nvtripy.flat_ir.ops.minimum import MinOp
 from nvtripy.flat_ir.ops.mul import MulOp
@@ -25,4 +25,7 @@ from nvtripy.flat_ir.ops.base import BaseFlatIROp
 @dataclass(repr=False)
 class AbsOp(BaseFlatIROp):
     def to_mlir(self, operands):
+        # NOTE: We intentionally do not lower floating point `abs` to a sign-bit mask (`bitcast_convert` + `and`).
+        # TensorRT maps `stablehlo.abs` to its unary ABS operation, which already compiles to a single
+        # instruction, whereas bitwise operations on reinterpreted floats are not supported by TensorRT.
         return [stablehlo.AbsOp(*operands)]
@@ -15,18 +15,97 @@
 # limitations under the License.
 #
 
+import contextlib
+import math
+import weakref
 from dataclasses import dataclass
-from typing import Sequence, Set, Union
+from typing import Dict, Optional, Sequence, Set, Tuple, Union
 
 import mlir_tensorrt.runtime.api as runtime
 from mlir_tensorrt.compiler import ir
 from mlir_tensorrt.compiler.dialects import stablehlo
 
 from nvtripy import utils
+from nvtripy.backend.mlir import utils as mlir_utils
 from nvtripy.backend.mlir.memref import create_memref
-from nvtripy.common import device
+from nvtripy.common import datatype, device
+from nvtripy.common import utils as common_utils
 from nvtripy.flat_ir.ops.base import BaseFlatIROp
 
+# Maps device memrefs to the attributes built from their data so that lowering the same constant multiple times
+# (e.g. across several compilations) only copies it to the host once. Entries are dropped along with the device memref.
+_DEVICE_CONSTANT_ATTR_CACHE: "weakref.WeakKeyDictionary[runtime.MemRefValue, ir.DenseElementsAttr]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Host buffers used to stage device constants, keyed by shape and data type. Since DenseElementsAttr copies the data
+# it is given, these can be reused by other constants of the same shape and type during a single lowering.
+_HOST_STAGING_BUFFERS: Dict[Tuple[Tuple[int, ...], runtime.ScalarTypeCode], runtime.MemRefValue] = {}
+
+# Data types for which Python scalars can be packed directly into a buffer that DenseElementsAttr understands.
+# Bools are excluded since MLIR-TRT represents them as i1 (see #208).
+_BUFFER_COMPATIBLE_DTYPES = {datatype.int32, datatype.int64, datatype.float32}
+
+# Attributes for splat constants (including scalars), keyed by data type, shape, and value.
+# Values like 0 and 1 recur throughout most programs, so this lets us build each of their attributes only once.
+# Since the MLIR context is a process-wide singleton (see `MLIRContext`), cached attributes remain valid across lowerings.
+_SPLAT_ATTR_CACHE: Dict[Tuple[datatype.dtype, Tuple[int, ...], Union[bool, int, str]], ir.DenseElementsAttr] = {}
+
+
+def _get_splat_attr(dtype: datatype.dtype, shape: Sequence[int], flat_data: Sequence) -> Optional[ir.DenseElementsAttr]:
+    """
+    Returns the (possibly cached) attribute for a constant if all of its elements are the same, or None otherwise.
+    """
+    if not flat_data:
+        return None
+
+    value = flat_data[0]
+    if flat_data.count(value) != len(flat_data):
+        return None
+
+    if isinstance(value, float):
+        # 0.0 and -0.0 compare equal, so check the signs explicitly.
+        if value == 0.0 and any(math.copysign(1.0, elem) != math.copysign(1.0, value) for elem in flat_data):
+            return None
+        # Key floats by their exact representation so that 0.0 and -0.0 (and NaNs) are cached separately.
+        value_key = value.hex()
+    else:
+        value_key = value
+
+    key = (dtype, tuple(shape), value_key)
+    attr = _SPLAT_ATTR_CACHE.get(key)
+    if attr is None:
+        mlir_dtype = mlir_utils.get_mlir_dtype(dtype)
+        attr = ir.DenseElementsAttr.get_splat(
+            ir.RankedTensorType.get(list(shape), mlir_dtype), mlir_utils.get_mlir_scalar_attr(mlir_dtype, value)
+        )
+        _SPLAT_ATTR_CACHE[key] = attr
+    return attr
+
+
+@contextlib.contextmanager
+def _staged_host_copy(device_memref: runtime.MemRefValue):
+    key = (tuple(device_memref.shape), device_memref.dtype)
+    # `MLIRRuntimeClient` is a process-wide singleton, so there is no need to hold on to it ourselves.
+    runtime_client = mlir_utils.MLIRRuntimeClient()
+    host_memref = _HOST_STAGING_BUFFERS.pop(key, None)
+    if host_memref is None:
+        host_memref = runtime_client.copy_to_host(device_memref=device_memref, stream=None)
+    else:
+        runtime_client.copy_to_host(device_memref=device_memref, existing_host_memref=host_memref, stream=None)
+
+    try:
+        yield host_memref
+    finally:
+        _HOST_STAGING_BUFFERS[key] = host_memref
+
+
+def release_host_staging_buffers() -> None:
+    """
+    Releases the host buffers used to stage device constants. This should be called once lowering is complete.
+    """
+    _HOST_STAGING_BUFFERS.clear()
+
 
 @dataclass(repr=False)
 class ConstantOp(BaseFlatIROp):
@@ -38,48 +117,71 @@ class ConstantOp(BaseFlatIROp):
             return {"data"}
         return set()
 
-    def to_mlir(self, operands):
+    def _host_memref_to_attr(self, data_memref: runtime.MemRefValue) -> ir.DenseElementsAttr:
         import array
+        import sys
+
+        # TODO: we can further drop the cast by tolist(memref) -> mlir
+        # Workaround (#208): bools are represented as i1 in MLIR-TRT but they cannot be used for DenseElementsAttr
+        # so we have to represent them as ints and then cast the result
+        if self.outputs[0].dtype == datatype.bool:
+            # need to use memoryview.cast to ensure that the view will be flattened
+            bool_bytes = memoryview(data_memref).cast("B")
+            # Widen each byte into an int32 with a strided copy rather than materializing a Python list of ints.
+            # The remaining bytes of each int32 are left as zeros.
+            int_array = array.array("i", [0]) * len(bool_bytes)
+            low_byte = 0 if sys.byteorder == "little" else int_array.itemsize - 1
+            memoryview(int_array).cast("B")[low_byte :: int_array.itemsize] = bool_bytes
+            int_memref = create_memref(
+                array=int_array,
+                shape=data_memref.shape,
+                dtype=datatype.int32,
+                device=device("cpu"),
+            )
+            return ir.DenseElementsAttr.get(
+                array=int_memref, type=mlir_utils.get_mlir_dtype(datatype.int32), shape=data_memref.shape
+            )
 
-        import nvtripy.common.datatype as datatype
-        from nvtripy.backend.mlir import utils as mlir_utils
+        return ir.DenseElementsAttr.get(
+            array=data_memref, type=mlir_utils.get_mlir_dtype(self.outputs[0].dtype), shape=data_memref.shape
+        )
 
+    def to_mlir(self, operands):
         # TODO(#189): Remove explicit copy to host for constants
         if isinstance(self.data, runtime.MemRefValue):
-            runtime_client = mlir_utils.MLIRRuntimeClient()
             data_memref = self.data
             if data_memref.address_space == runtime.PointerType.device:
-                data_memref = runtime_client.copy_to_host(
-                    device_memref=data_memref,
-                    stream=None,
-                )
-
-            # TODO: we can further drop the cast by tolist(memref) -> mlir
-            # Workaround (#208): bools are represented as i1 in MLIR-TRT but they cannot be used for DenseElementsAttr
-            # so we have to represent them as ints and then cast the result
+                attr = _DEVICE_CONSTANT_ATTR_CACHE.get(data_memref)
+                if attr is None:
+                    # DenseElementsAttr needs to read the data on the host, so we cannot pass the device memref directly.
+                    with _staged_host_copy(data_memref) as host_memref:
+                        attr = self._host_memref_to_attr(host_memref)
+                    _DEVICE_CONSTANT_ATTR_CACHE[data_memref] = attr
+            else:
+                attr = self._host_memref_to_attr(data_memref)
+
             if self.outputs[0].dtype == datatype.bool:
-                # need to use memoryview.cast to ensure that the view will be flattened
-                int_memref = create_memref(
-                    array=array.array("i", memoryview(data_memref).cast("b").tolist()),
-                    shape=self.data.shape,
-                    dtype=datatype.int32,
-                    device=device("cpu"),
-                )
-                attr = ir.DenseElementsAttr.get(
-                    array=int_memref, type=mlir_utils.get_mlir_dtype(datatype.int32), shape=data_memref.shape
-                )
                 cast_output = mlir_utils.make_mlir_tensor(datatype.bool, data_memref.shape)
                 constant_op = stablehlo.ConstantOp(attr)
                 return [stablehlo.ConvertOp(result=cast_output, operand=constant_op)]
-
-            attr = ir.DenseElementsAttr.get(
-                array=data_memref, type=mlir_utils.get_mlir_dtype(self.outputs[0].dtype), shape=data_memref.shape
-            )
         else:
             out_dtype = self.outputs[0].dtype
-            attr = ir.DenseElementsAttr.get(
-                attrs=mlir_utils.list_to_dense_attr(self.data, mlir_utils.get_mlir_dtype(out_dtype)),
-                type=self.outputs[0].to_mlir(),
-            )
+            flat_data = mlir_utils.flatten_constant_data(self.data)
+            shape = utils.utils.get_shape(self.data)
+            attr = _get_splat_attr(out_dtype, shape, flat_data)
+            if attr is None:
+                if flat_data and out_dtype in _BUFFER_COMPATIBLE_DTYPES:
+                    # Build the attribute from a single typed buffer rather than creating an attribute per element.
+                    attr = ir.DenseElementsAttr.get(
+                        array=common_utils.convert_list_to_array(flat_data, out_dtype),
+                        type=mlir_utils.get_mlir_dtype(out_dtype),
+                        shape=shape,
+                    )
+                else:
+                    mlir_dtype = mlir_utils.get_mlir_dtype(out_dtype)
+                    attr = ir.DenseElementsAttr.get(
+                        attrs=[mlir_utils.get_mlir_scalar_attr(mlir_dtype, elem) for elem in flat_data],
+                        type=self.outputs[0].to_mlir(),
+                    )
 
         return [stablehlo.ConstantOp(attr)]
@@ -16,10 +16,15 @@
 #
 
 from dataclasses import dataclass
+from itertools import chain
+from typing import Optional
 
+from mlir_tensorrt.compiler import ir
 from mlir_tensorrt.compiler.dialects import stablehlo
 
 from collections.abc import Sequence
+from nvtripy.common import datatype
+from nvtripy.common import utils as common_utils
 from nvtripy.flat_ir.ops.base import BaseFlatIROp
 
 
@@ -28,8 +33,17 @@ class ConvolutionOp(BaseFlatIROp):
     padding: Sequence[Sequence[int]]
     stride: Sequence[int]
     feature_group_count: int
-    lhs_dilation: Sequence[int]
-    rhs_dilation: Sequence[int]
+    lhs_dilation: Optional[Sequence[int]]
+    rhs_dilation: Optional[Sequence[int]]
+
+    def _padding_attr(self) -> ir.DenseElementsAttr:
+        # Build the [num_spatial_dims, 2] padding attribute from one flat int64 buffer
+        # instead of converting each (low, high) pair separately.
+        return ir.DenseElementsAttr.get(
+            array=common_utils.convert_list_to_array(list(chain.from_iterable(self.padding)), datatype.int64),
+            type=ir.IntegerType.get_signless(64),
+            shape=[len(self.padding), 2],
+        )
 
     def to_mlir(self, operands):
         # convolution spec: https://github.com/openxla/stablehlo/blob/main/docs/spec.md#convolution
@@ -67,10 +81,10 @@ class ConvolutionOp(BaseFlatIROp):
             dimension_numbers=dnums,
             feature_group_count=self.feature_group_count,
             batch_group_count=1,
-            window_strides=self.stride,
-            padding=self.padding,
-            lhs_dilation=self.lhs_dilation,
-            rhs_dilation=self.rhs_dilation,
+            window_strides=ir.DenseI64ArrayAttr.get(self.stride),
+            padding=self._padding_attr() if self.padding else None,
+            lhs_dilation=ir.DenseI64ArrayAttr.get(self.lhs_dilation) if self.lhs_dilation is not None else None,
+            rhs_dilation=ir.DenseI64ArrayAttr.get(self.rhs_dilation) if self.rhs_dilation is not None else None,
             window_reversal=None,
         )
         return [output]
@@ -25,4 +25,7 @@ from nvtripy.flat_ir.ops.base import BaseFlatIROp
 @dataclass(repr=False)
 class RsqrtOp(BaseFlatIROp):
     def to_mlir(self, operands):
+        # NOTE: There is no need to special-case fp32 with a custom call to an approximate intrinsic here.
+        # Code generation for the instruction sequence is left to TensorRT (which fuses pointwise operations)
+        # and a custom call would require a plugin, preventing that fusion entirely.
         return [stablehlo.RsqrtOp(*operands)]
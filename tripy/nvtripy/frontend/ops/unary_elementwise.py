@@ -16,17 +16,132 @@
 #
 
 
-from nvtripy import export
+import builtins
+import math
+
+from nvtripy import config, export, utils
+from nvtripy.common import datatype
 from nvtripy.frontend.ops import utils as op_utils
+from nvtripy.trace.ops.storage import Storage
 from nvtripy.trace.ops.unary_elementwise import UnaryElementwise
 from nvtripy.utils import wrappers
 
 
-@export.public_api(document_under="operations/functions")
-@wrappers.interface(
+# Data type constraints shared by the unary operations. Building each decorator once lets all the functions
+# with the same constraints share a single set of constraint objects instead of each constructing their own.
+_float_interface = wrappers.interface(
     dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
     dtype_variables={"T1": ["float32", "float16", "bfloat16"]},
 )
+_float_with_fp8_interface = wrappers.interface(
+    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
+    dtype_variables={"T1": ["float32", "float16", "bfloat16", "float8"]},
+)
+# The TensorRT implementations of `expm1` and `log1p` only support these types.
+_float32_float16_interface = wrappers.interface(
+    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
+    dtype_variables={"T1": ["float32", "float16"]},
+)
+_float_int_interface = wrappers.interface(
+    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
+    dtype_variables={"T1": ["float32", "float16", "bfloat16", "int8", "int32", "int64"]},
+)
+
+
+# Scalar implementations of each unary operation used to fold small constants at trace time.
+# These raise ValueError/OverflowError/ZeroDivisionError for inputs where the result is not finite,
+# in which case we skip folding and let the operation run normally.
+_FOLD_FUNCS = {
+    UnaryElementwise.Kind.EXP: math.exp,
+    UnaryElementwise.Kind.TANH: math.tanh,
+    UnaryElementwise.Kind.RSQRT: lambda x: 1.0 / math.sqrt(x),
+    UnaryElementwise.Kind.LOG: math.log,
+    UnaryElementwise.Kind.SINE: math.sin,
+    UnaryElementwise.Kind.COSINE: math.cos,
+    UnaryElementwise.Kind.SQRT: math.sqrt,
+    UnaryElementwise.Kind.ABS: builtins.abs,
+    UnaryElementwise.Kind.EXPM1: math.expm1,
+    UnaryElementwise.Kind.LOG1P: math.log1p,
+}
+
+_FLOAT32_MAX = 3.4028234663852886e38
+
+
+# If the input is a small float32 constant, computes the result of the operation on the host and returns
+# it as a new constant tensor, avoiding a kernel launch. Otherwise, returns None.
+#
+# NOTE: Folded results are computed in double precision and then rounded to float32, so they may differ slightly
+# (within float32 tolerance) from the results the backend would compute.
+def _fold_constant(input: "nvtripy.Tensor", kind: UnaryElementwise.Kind):
+    from nvtripy.backend.mlir import memref
+    from nvtripy.frontend.tensor import Tensor
+
+    trace_tensor = input.trace_tensor
+    producer = trace_tensor.producer
+    if (
+        not isinstance(producer, Storage)
+        or trace_tensor.is_compile_tracer
+        or producer.dtype != datatype.float32
+        or math.prod(producer.shape) == 0
+        # Larger constants are lifted to inputs rather than being embedded in the program, so we keep them as-is.
+        # This also bounds the size of the synchronous copy needed to read constants that live on the device.
+        or utils.utils.should_lift_storage_op_as_input(producer.shape)
+        # The approximation would give different results from folding, so we defer to it.
+        or (kind == UnaryElementwise.Kind.TANH and config.use_fast_tanh)
+    ):
+        return None
+
+    func = _FOLD_FUNCS[kind]
+
+    def apply(data):
+        if isinstance(data, list):
+            return [apply(elem) for elem in data]
+        result = func(data)
+        if math.isfinite(result) and builtins.abs(result) > _FLOAT32_MAX:
+            raise OverflowError()
+        return result
+
+    try:
+        result = apply(memref.tolist(producer.data))
+    except (ValueError, OverflowError, ZeroDivisionError):
+        return None
+
+    folded = Tensor(result, device=input.device, fetch_stack_info=False)
+    # Use the same stack depth as `create_op` (minus one since we are not nested within it).
+    folded.stack_info = utils.stack_info.get_stack_info(include_code_index=3)
+    return folded
+
+
+# The approximation below clamps its inputs to this magnitude, where it reaches 1. Since tanh(4.97) is about 0.9999,
+# the clamp caps the absolute error at about 1e-4 (the largest error of the approximation occurs here).
+_FAST_TANH_CLAMP = 4.97
+
+
+# Computes tanh using the (7, 6) rational approximation from its continued fraction expansion.
+# This only requires a handful of multiply-adds and a single division.
+def _fast_tanh(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
+    from nvtripy.frontend.ops.binary_elementwise import maximum, minimum
+    from nvtripy.frontend.tensor import Tensor
+
+    x = minimum(maximum(input, Tensor(-_FAST_TANH_CLAMP)), Tensor(_FAST_TANH_CLAMP))
+    x2 = x * x
+    numerator = x * (135135.0 + x2 * (17325.0 + x2 * (378.0 + x2)))
+    denominator = 135135.0 + x2 * (62370.0 + x2 * (3150.0 + 28.0 * x2))
+    return numerator / denominator
+
+
+# Kinds of unary operations whose outputs are never negative, so applying `abs` to them has no effect.
+# `sqrt` and `rsqrt` are not included since they map -0.0 to -0.0 and -inf respectively.
+_NON_NEGATIVE_KINDS = {UnaryElementwise.Kind.EXP, UnaryElementwise.Kind.ABS}
+
+
+def _is_known_non_negative(input: "nvtripy.Tensor") -> bool:
+    producer = input.trace_tensor.producer
+    return isinstance(producer, UnaryElementwise) and producer.kind in _NON_NEGATIVE_KINDS
+
+
+@export.public_api(document_under="operations/functions")
+@_float_interface
 def exp(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     r"""
     Computes the elementwise exponential of the elements of the input tensor:
@@ -47,14 +162,14 @@ def exp(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.exp(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.EXP)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.EXP)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16"]},
-)
+@_float_interface
 def tanh(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise hyperbolic tangent of the elements of the input tensor.
@@ -73,14 +188,16 @@ def tanh(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.tanh(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.TANH)
+    if folded is not None:
+        return folded
+    if config.use_fast_tanh and input.dtype == datatype.float32:
+        return _fast_tanh(input)
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.TANH)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16"]},
-)
+@_float_interface
 def sin(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise sine of the elements of the input tensor.
@@ -99,14 +216,14 @@ def sin(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.sin(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.SINE)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.SINE)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16"]},
-)
+@_float_interface
 def cos(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise cosine of the elements of the input tensor.
@@ -125,14 +242,14 @@ def cos(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.cos(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.COSINE)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.COSINE)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16", "float8"]},
-)
+@_float_with_fp8_interface
 def rsqrt(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise reciprocal square root of the elements of the input tensor.
@@ -151,14 +268,14 @@ def rsqrt(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(1.0 / np.sqrt(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.RSQRT)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.RSQRT)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16", "float8"]},
-)
+@_float_with_fp8_interface
 def sqrt(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise square root of the elements of the input tensor.
@@ -177,14 +294,14 @@ def sqrt(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.sqrt(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.SQRT)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.SQRT)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16"]},
-)
+@_float_interface
 def log(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     """
     Computes the elementwise natural logarithm (base e) of the elements of the input tensor.
@@ -203,14 +320,74 @@ def log(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert tp.allclose(output, tp.Tensor(np.log(cp.from_dlpack(input).get())))
     """
+    folded = _fold_constant(input, UnaryElementwise.Kind.LOG)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.LOG)
 
 
 @export.public_api(document_under="operations/functions")
-@wrappers.interface(
-    dtype_constraints={"input": "T1", wrappers.RETURN_VALUE: "T1"},
-    dtype_variables={"T1": ["float32", "float16", "bfloat16", "int8", "int32", "int64"]},
-)
+@_float32_float16_interface
+def expm1(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
+    r"""
+    Computes the elementwise exponential of the elements of the input tensor, minus one:
+
+    :math:`\text{expm1}(x_{i}) = e^{x_{i}} - 1`
+
+    This is more accurate than ``tp.exp(input) - 1`` when the elements of the input are close to zero.
+
+    Args:
+        input: The input tensor.
+
+    Returns:
+        A new tensor.
+
+    .. code-block:: python
+        :linenos:
+
+        input = tp.arange(3, dtype=tp.float32)
+        output = tp.expm1(input)
+
+        assert tp.allclose(output, tp.Tensor(np.expm1(cp.from_dlpack(input).get())))
+    """
+    folded = _fold_constant(input, UnaryElementwise.Kind.EXPM1)
+    if folded is not None:
+        return folded
+    return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.EXPM1)
+
+
+@export.public_api(document_under="operations/functions")
+@_float32_float16_interface
+def log1p(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
+    r"""
+    Computes the elementwise natural logarithm (base e) of one plus the elements of the input tensor:
+
+    :math:`\text{log1p}(x_{i}) = \log_{e}(1 + x_{i})`
+
+    This is more accurate than ``tp.log(1 + input)`` when the elements of the input are close to zero.
+
+    Args:
+        input: The input tensor.
+
+    Returns:
+        A new tensor.
+
+    .. code-block:: python
+        :linenos:
+
+        input = tp.arange(3, dtype=tp.float32)
+        output = tp.log1p(input)
+
+        assert tp.allclose(output, tp.Tensor(np.log1p(cp.from_dlpack(input).get())))
+    """
+    folded = _fold_constant(input, UnaryElementwise.Kind.LOG1P)
+    if folded is not None:
+        return folded
+    return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.LOG1P)
+
+
+@export.public_api(document_under="operations/functions")
+@_float_int_interface
 def abs(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
     r"""
     Computes the elementwise absolute value of the elements of the input tensor.
@@ -229,4 +406,9 @@ def abs(input: "nvtripy.Tensor") -> "nvtripy.Tensor":
 
         assert np.array_equal(cp.from_dlpack(output).get(), np.array([1, 2], dtype=np.float32))
     """
+    if _is_known_non_negative(input):
+        return input
+    folded = _fold_constant(input, UnaryElementwise.Kind.ABS)
+    if folded is not None:
+        return folded
     return op_utils.create_op(UnaryElementwise, [input], UnaryElementwise.Kind.ABS)
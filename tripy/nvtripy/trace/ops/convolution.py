@@ -17,6 +17,7 @@
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Optional
 
 import nvtripy.trace.ops.utils as op_utils
 from nvtripy.trace.ops.base import BaseTraceOp
@@ -27,8 +28,20 @@ class Convolution(BaseTraceOp):
     padding: Sequence[Sequence[int]]
     stride: Sequence[int]
     groups: int
-    lhs_dilation: Sequence[int]
-    rhs_dilation: Sequence[int]
+    lhs_dilation: Optional[Sequence[int]]
+    rhs_dilation: Optional[Sequence[int]]
+
+    def __post_init__(self):
+        # Canonicalize the window parameters into tuples up front so that lowering does not
+        # need to re-box them and so that every consumer sees the same representation.
+        def canonicalize(values):
+            return tuple(values) if values is not None else None
+
+        self.padding = tuple(canonicalize(dim_padding) for dim_padding in self.padding)
+        self.stride = canonicalize(self.stride)
+        self.lhs_dilation = canonicalize(self.lhs_dilation)
+        self.rhs_dilation = canonicalize(self.rhs_dilation)
+        super().__post_init__()
 
     infer_rank = op_utils.InferRankPolicies.same_as_input()
 
@@ -19,12 +19,21 @@ import enum
 from dataclasses import dataclass
 
 import nvtripy.trace.ops.utils as op_utils
+from nvtripy.flat_ir.ops import AbsOp, CosineOp, ExpOp, Expm1Op, Log1pOp, LogOp, RsqrtOp, SineOp, SqrtOp, TanhOp
 from nvtripy.trace.ops.base import BaseTraceOp
 
 
 @dataclass(repr=False)
 class UnaryElementwise(BaseTraceOp):
-    class Kind(enum.Enum):
+    # An `IntEnum` lets us index directly into lookup tables and compare kinds as plain integers.
+    class Kind(enum.IntEnum):
+        # Keep the `Kind.NAME` string representation. Otherwise, `str()` gives just the value on Python 3.11+
+        # and formatting (e.g. in f-strings) gives just the value on Python 3.9 and 3.10.
+        __str__ = enum.Enum.__str__
+
+        def __format__(self, format_spec):
+            return format(str(self), format_spec)
+
         EXP = 0
         TANH = 1
         RSQRT = 2
@@ -33,6 +42,8 @@ class UnaryElementwise(BaseTraceOp):
         COSINE = 5
         SQRT = 6
         ABS = 7
+        EXPM1 = 8
+        LOG1P = 9
 
     kind: Kind
 
@@ -42,16 +53,13 @@ class UnaryElementwise(BaseTraceOp):
     # require float inputs but shapes are always int
 
     def to_flat_ir(self, inputs, outputs):
-        from nvtripy.flat_ir.ops import AbsOp, CosineOp, ExpOp, LogOp, RsqrtOp, SineOp, SqrtOp, TanhOp
-
-        OpType = {
-            UnaryElementwise.Kind.EXP: ExpOp,
-            UnaryElementwise.Kind.TANH: TanhOp,
-            UnaryElementwise.Kind.RSQRT: RsqrtOp,
-            UnaryElementwise.Kind.LOG: LogOp,
-            UnaryElementwise.Kind.SINE: SineOp,
-            UnaryElementwise.Kind.COSINE: CosineOp,
-            UnaryElementwise.Kind.SQRT: SqrtOp,
-            UnaryElementwise.Kind.ABS: AbsOp,
-        }[self.kind]
-        OpType.build(inputs, outputs)
+        _BUILDERS[self.kind](inputs, outputs)
+
+
+# FlatIR operations for each kind of unary operation, indexed by kind, so this must be kept in the same order
+# as `UnaryElementwise.Kind`. This is built once rather than on every call to `to_flat_ir`.
+_FLAT_IR_OP_TYPES = (ExpOp, TanhOp, RsqrtOp, LogOp, SineOp, CosineOp, SqrtOp, AbsOp, Expm1Op, Log1pOp)
+
+
+# The bound `build` methods of the above, so that lowering a unary operation is a single indexed call.
+_BUILDERS = tuple(OpType.build for OpType in _FLAT_IR_OP_TYPES)
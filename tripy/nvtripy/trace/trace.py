@@ -86,9 +86,37 @@ class Trace:
 
         # Reverse the order of the layers so they are topologically sorted
         self.ops = topological_sort(self.ops)
+        self._eliminate_duplicate_unary_ops()
 
         logger.trace(lambda: f"{self}\n")
 
+    def _eliminate_duplicate_unary_ops(self):
+        # Applying the same unary operation to the same tensor more than once yields identical results,
+        # so we only keep the first such op and make consumers of the others use its output instead.
+        # Ops producing trace outputs are always kept since their outputs must be materialized.
+        from nvtripy.trace.ops.unary_elementwise import UnaryElementwise
+
+        output_ids = set(id(out) for out in self.outputs)
+        canonical_outputs = {}
+        replacements = {}
+        ops = []
+        for op in self.ops:
+            if any(id(inp) in replacements for inp in op.inputs):
+                # Copy the op so that we don't modify the graph of the frontend tensors.
+                op = copy.copy(op)
+                op.inputs = [replacements.get(id(inp), inp) for inp in op.inputs]
+
+            if isinstance(op, UnaryElementwise):
+                key = (op.kind, id(op.inputs[0]))
+                if key in canonical_outputs and id(op.outputs[0]) not in output_ids:
+                    replacements[id(op.outputs[0])] = canonical_outputs[key]
+                    continue
+                canonical_outputs.setdefault(key, op.outputs[0])
+
+            ops.append(op)
+
+        self.ops = ops
+
     def __str__(self) -> str:
         layer_strs: List[str] = []
         if self.shapes:
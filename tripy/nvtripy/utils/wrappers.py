@@ -291,6 +291,8 @@ def interface(
             else {name for name, param in signature.parameters.items() if param.annotation in {TensorLike, ShapeLike}}
         )
         shape_likes = {name for name, param in signature.parameters.items() if param.annotation is ShapeLike}
+        # Sets of supported data type names so that checking arguments does not need to scan a list on every call.
+        supported_dtype_names = {type_var: frozenset(dtypes) for type_var, dtypes in dtype_variables.items()}
 
         # if no dtype constraints have been specified at all, do not add to the table so we don't generate invalid tests
         if dtype_constraints or dtype_variables or dtype_exceptions:
@@ -340,7 +342,7 @@ def interface(
 
                     # Check if the type is supported at all
                     supported_dtypes = dtype_variables[type_var]
-                    if arg_dtype.name not in supported_dtypes:
+                    if arg_dtype.name not in supported_dtype_names[type_var]:
                         raise_error(
                             f"Unsupported data type for '{func.__qualname__}'.",
                             [
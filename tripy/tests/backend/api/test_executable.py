@@ -17,11 +17,13 @@ import os
 import tempfile
 from typing import Sequence
 
+import mlir_tensorrt.runtime.api as runtime
 import pytest
 from tests import helper
 from tests.backend.api.conftest import *
 
 import nvtripy as tp
+from nvtripy.utils import json as json_utils
 
 
 @pytest.fixture(scope="session")
@@ -110,6 +112,7 @@ class TestExecutable:
             exe_file = os.path.join(temp_dir, "executable.json")
             single_return_executable.save(exe_file)
             assert os.path.exists(exe_file)
+            assert os.path.exists(f"{exe_file}.engine")
             loaded_executable = tp.Executable.load(exe_file)
             assert loaded_executable.__signature__ == single_return_executable.__signature__
 
@@ -117,3 +120,50 @@ class TestExecutable:
             out1 = single_return_executable(inp, inp)
             out2 = loaded_executable(inp, inp)
             assert tp.equal(out1, out2)
+
+    def test_load_embedded_executable(self, single_return_executable):
+        # Executables which embed the serialized executable in the JSON file should still be loadable.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exe_file = os.path.join(temp_dir, "executable.json")
+            json_utils.save(single_return_executable, exe_file)
+            loaded_executable = tp.Executable.load(exe_file)
+            assert loaded_executable.__signature__ == single_return_executable.__signature__
+
+            inp = tp.iota((2, 2), dtype=tp.float32)
+            assert tp.equal(single_return_executable(inp, inp), loaded_executable(inp, inp))
+
+
+class TestExecuteErrors:
+    def test_dtype_error(self, single_return_executable):
+        args = [tp.ones((2, 2), dtype=tp.float32), tp.ones((2, 2), dtype=tp.float16)]
+        err = runtime.MTRTException("InvalidArgument: function expects a memref type with element type f32 but got f16")
+
+        with helper.raises(tp.TripyException, "Unexpected tensor data type.", has_stack_info_for=[args[1]]) as exc_info:
+            single_return_executable._handle_execute_error(err, args)
+        assert "For parameter b, expected data type: float32 but got: float16" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            "InternalError: failed to set input shape",
+            "InvalidArgument: Runtime shape mismatch",
+        ],
+    )
+    def test_shape_error(self, msg, single_return_executable):
+        args = [tp.ones((2, 2), dtype=tp.float32), tp.ones((2, 3), dtype=tp.float32)]
+
+        with helper.raises(tp.TripyException, "Unexpected tensor shape.", has_stack_info_for=[args[1]]) as exc_info:
+            single_return_executable._handle_execute_error(runtime.MTRTException(msg), args)
+        assert "Dimension 1 has a shape of 3, which is not within the expected bounds of [2, 2]" in str(exc_info.value)
+
+    def test_stride_error(self, single_return_executable):
+        args = [tp.ones((2, 2), dtype=tp.float32), tp.ones((2, 2), dtype=tp.float32)]
+        msg = "InvalidArgument: Runtime stride mismatch. Expected [2, 1] but received [1, 2]"
+
+        with helper.raises(tp.TripyException, "Runtime stride mismatch"):
+            single_return_executable._handle_execute_error(runtime.MTRTException(msg), args)
+
+    def test_unknown_error_is_not_handled(self, single_return_executable):
+        args = [tp.ones((2, 2), dtype=tp.float32), tp.ones((2, 2), dtype=tp.float32)]
+        # Errors without a more helpful message are left for the caller to re-raise.
+        single_return_executable._handle_execute_error(runtime.MTRTException("Some other error"), args)
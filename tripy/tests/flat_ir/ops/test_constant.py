@@ -0,0 +1,127 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import gc
+
+import cupy as cp
+import numpy as np
+import pytest
+from mlir_tensorrt.compiler import ir
+
+from nvtripy.backend.mlir import memref
+from nvtripy.backend.mlir import utils as mlir_utils
+from nvtripy.common.datatype import bool as tp_bool
+from nvtripy.common.datatype import float32, int32
+from nvtripy.common.device import device
+from nvtripy.flat_ir.ops import ConstantOp
+from nvtripy.flat_ir.ops import constant as constant_module
+from nvtripy.flat_ir.tensor import FlatIRTensor
+
+
+def make_constant(data, dtype=int32, shape=None):
+    shape = shape if shape is not None else [len(data)]
+    out = FlatIRTensor.build(shape=shape, rank=len(shape), dtype=dtype, reason_details="", device=device("gpu"))
+    op = ConstantOp.build([], [out], data=data)
+    out.producer = op
+    return op
+
+
+# Creates a constant backed by a memref view of the provided cupy (device) or numpy (host) array.
+def make_memref_constant(array, dtype):
+    return make_constant(memref.create_memref_view(array), dtype=dtype, shape=list(array.shape))
+
+
+def lower(op):
+    with mlir_utils.make_ir_context(), ir.Location.unknown():
+        module = ir.Module.create()
+        with ir.InsertionPoint(module.body):
+            (out,) = op.to_mlir([])
+        return out
+
+
+def expected_attr(array):
+    with mlir_utils.make_ir_context():
+        return ir.DenseElementsAttr.get(np.ascontiguousarray(array))
+
+
+class TestSplatConstants:
+    def lower(self, op):
+        return lower(op).attributes["value"]
+
+    def test_splat_attr_is_reused(self):
+        first = self.lower(make_constant([1, 1, 1]))
+        second = self.lower(make_constant([1, 1, 1]))
+        assert isinstance(first, ir.DenseElementsAttr) and first.is_splat
+        assert first == second
+
+    def test_negative_zero_is_not_conflated(self):
+        positive = self.lower(make_constant([0.0, 0.0], dtype=float32))
+        negative = self.lower(make_constant([-0.0, -0.0], dtype=float32))
+        mixed = self.lower(make_constant([0.0, -0.0], dtype=float32))
+        assert positive != negative
+        assert not mixed.is_splat
+
+
+class TestMemRefConstants:
+    @pytest.mark.parametrize("module", [np, cp])
+    def test_bool_constant(self, module):
+        data = module.array([[True, False, True], [False, False, True]])
+
+        out = lower(make_memref_constant(data, tp_bool))
+
+        # Bools are lowered as an int32 constant followed by a conversion.
+        constant = out.operation.operands[0].owner
+        assert constant.attributes["value"] == expected_attr(np.array([[1, 0, 1], [0, 0, 1]], dtype=np.int32))
+
+    def test_device_constant_attr_is_cached(self, monkeypatch):
+        op = make_memref_constant(cp.array([1, 2, 3], dtype=cp.int32), int32)
+
+        attr = lower(op).attributes["value"]
+        assert constant_module._DEVICE_CONSTANT_ATTR_CACHE[op.data] == attr
+
+        # Lowering the constant again should reuse the attribute without copying the data to the host.
+        def fail(*args, **kwargs):
+            assert False, "Cached constant should not be copied to the host"
+
+        monkeypatch.setattr(constant_module, "_staged_host_copy", fail)
+        assert lower(op).attributes["value"] == attr
+
+    def test_device_constant_attr_cache_is_invalidated(self):
+        op = make_memref_constant(cp.array([4, 5, 6], dtype=cp.int32), int32)
+        lower(op)
+
+        num_entries = len(constant_module._DEVICE_CONSTANT_ATTR_CACHE)
+        del op
+        gc.collect()
+        assert len(constant_module._DEVICE_CONSTANT_ATTR_CACHE) == num_entries - 1
+
+    def test_staging_buffer_is_reused(self):
+        constant_module.release_host_staging_buffers()
+        first_data = cp.array([[1, 2], [3, 4]], dtype=cp.int32)
+        second_data = cp.array([[5, 6], [7, 8]], dtype=cp.int32)
+
+        first = lower(make_memref_constant(first_data, int32)).attributes["value"]
+        (staging_buffer,) = constant_module._HOST_STAGING_BUFFERS.values()
+        second = lower(make_memref_constant(second_data, int32)).attributes["value"]
+
+        # The second constant should have been copied into the same host buffer as the first.
+        assert list(constant_module._HOST_STAGING_BUFFERS.values()) == [staging_buffer]
+        assert first == expected_attr(cp.asnumpy(first_data))
+        assert second == expected_attr(cp.asnumpy(second_data))
+
+        constant_module.release_host_staging_buffers()
+        assert not constant_module._HOST_STAGING_BUFFERS
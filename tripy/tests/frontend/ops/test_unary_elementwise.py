@@ -0,0 +1,116 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import math
+
+import numpy as np
+import pytest
+
+import nvtripy as tp
+from nvtripy.trace.ops.storage import Storage
+from nvtripy.trace.ops.unary_elementwise import UnaryElementwise
+
+
+class TestAbs:
+    @pytest.mark.parametrize("func", [tp.exp, tp.abs, lambda x: tp.exp(tp.tanh(x))])
+    def test_abs_of_non_negative_is_identity(self, func):
+        t = func(tp.ones((2, 3)))
+        assert tp.abs(t) is t
+
+    @pytest.mark.parametrize("func", [tp.tanh, tp.sqrt, tp.rsqrt, lambda x: x])
+    def test_abs_of_possibly_negative_is_not_skipped(self, func):
+        t = func(tp.ones((2, 3)))
+        assert tp.abs(t) is not t
+
+
+def host_tensor(data):
+    return tp.Tensor(np.array(data, dtype=np.float32))
+
+
+class TestConstantFolding:
+    def test_small_constant_is_folded(self):
+        out = tp.exp(host_tensor([0.0, 1.0]))
+        assert isinstance(out.trace_tensor.producer, Storage)
+        assert out.dtype == tp.float32
+        assert tp.allclose(out, tp.Tensor([1.0, math.e]))
+
+    @pytest.mark.parametrize(
+        "func, data",
+        [
+            (tp.exp, [-2.0, 0.5, 3.0]),
+            (tp.tanh, [-2.0, 0.5, 3.0]),
+            (tp.rsqrt, [0.25, 2.0, 9.0]),
+            (tp.log, [0.25, 2.0, 9.0]),
+            (tp.sin, [-2.0, 0.5, 3.0]),
+            (tp.cos, [-2.0, 0.5, 3.0]),
+            (tp.sqrt, [0.25, 2.0, 9.0]),
+            (tp.abs, [-2.0, 0.5, 3.0]),
+            (tp.expm1, [-2.0, 1e-5, 3.0]),
+            (tp.log1p, [1e-5, 2.0, 9.0]),
+        ],
+    )
+    def test_folded_matches_unfolded(self, func, data):
+        folded = func(host_tensor(data))
+        # Reshaping means the input is no longer a constant, so the operation will not be folded.
+        unfolded = func(tp.reshape(host_tensor(data), (len(data),)))
+
+        assert isinstance(folded.trace_tensor.producer, Storage)
+        assert not isinstance(unfolded.trace_tensor.producer, Storage)
+        assert tp.allclose(folded, unfolded, rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.parametrize(
+        "func, data",
+        [
+            # Results which are not finite are left to the backend.
+            (tp.log, [0.0, 1.0]),
+            (tp.sqrt, [-1.0]),
+            (tp.exp, [1000.0]),
+            # Large constants are not folded.
+            (tp.exp, [0.0] * 64),
+        ],
+    )
+    def test_not_folded(self, func, data):
+        out = func(host_tensor(data))
+        assert isinstance(out.trace_tensor.producer, UnaryElementwise)
+
+    def test_device_constant_is_folded(self):
+        out = tp.exp(tp.Tensor([0.0, 1.0]))
+        assert isinstance(out.trace_tensor.producer, Storage)
+        assert tp.allclose(out, tp.Tensor([1.0, math.e]))
+
+    def test_not_folded_with_fast_tanh(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "use_fast_tanh", True)
+        out = tp.tanh(host_tensor([0.0, 1.0]))
+        assert not isinstance(out.trace_tensor.producer, Storage)
+
+
+class TestFastTanh:
+    @pytest.fixture
+    def use_fast_tanh(self, monkeypatch):
+        monkeypatch.setattr(tp.config, "use_fast_tanh", True)
+
+    def test_approximation_is_used(self, use_fast_tanh):
+        out = tp.tanh(tp.ones((2, 3)))
+        assert not isinstance(out.trace_tensor.producer, UnaryElementwise)
+
+    def test_approximation_is_not_used_for_float16(self, use_fast_tanh):
+        out = tp.tanh(tp.ones((2, 3), dtype=tp.float16))
+        assert isinstance(out.trace_tensor.producer, UnaryElementwise)
+
+    def test_approximation_is_close(self, use_fast_tanh):
+        data = [-10.0, -3.0, -0.5, 0.0, 0.25, 1.0, 4.0, 20.0]
+        inp = tp.reshape(tp.Tensor(data), (2, 4))
+        assert tp.allclose(tp.tanh(inp), tp.reshape(tp.Tensor([math.tanh(v) for v in data]), (2, 4)), atol=1e-3)
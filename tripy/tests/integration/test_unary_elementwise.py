@@ -30,6 +30,8 @@ _UNARY_OPS = {
     tp.cos: np.cos,
     tp.sqrt: np.sqrt,
     tp.abs: np.abs,
+    tp.expm1: np.expm1,
+    tp.log1p: np.log1p,
 }
 
 
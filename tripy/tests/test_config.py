@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 
+import pytest
+
 import nvtripy as tp
 
 
@@ -42,3 +44,53 @@ def test_timing_cache(tmp_path):
     assert tp.config.timing_cache_file_path == str(
         dummy_file
     ), f"get_timing_cache_file() path does not match the user provided path {str(dummy_file)}"
+
+
+@pytest.fixture
+def executable_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "executables"
+    monkeypatch.setattr(tp.config, "use_executable_disk_cache", True)
+    monkeypatch.setattr(tp.config, "executable_cache_dir_path", str(cache_dir))
+    return cache_dir
+
+
+def _compile_add():
+    def func(a, b):
+        return a + b
+
+    return tp.compile(func, args=[tp.InputInfo((2,), dtype=tp.float32), tp.InputInfo((2,), dtype=tp.float32)])
+
+
+def test_executable_disk_cache(executable_cache_dir):
+    compiled_func = _compile_add()
+    assert len(list(executable_cache_dir.iterdir())) == 1, "Executable was not written to the cache."
+
+    # Compiling the same function again should reuse the cached executable.
+    cached_func = _compile_add()
+    assert len(list(executable_cache_dir.iterdir())) == 1
+
+    a = tp.ones((2,), dtype=tp.float32)
+    assert tp.equal(compiled_func(a, a), cached_func(a, a))
+
+
+def test_executable_disk_cache_is_keyed_on_tensorrt_version(executable_cache_dir, monkeypatch):
+    import tensorrt
+
+    _compile_add()
+    monkeypatch.setattr(tensorrt, "__version__", "0.0.0")
+    _compile_add()
+
+    assert len(list(executable_cache_dir.iterdir())) == 2
+
+
+def test_executable_disk_cache_recovers_from_corrupt_entry(executable_cache_dir):
+    _compile_add()
+    (cache_file,) = executable_cache_dir.iterdir()
+    cache_file.write_bytes(b"not an executable")
+
+    compiled_func = _compile_add()
+
+    a = tp.ones((2,), dtype=tp.float32)
+    assert tp.equal(compiled_func(a, a), tp.Tensor([2.0, 2.0]))
+    # The corrupt entry should be replaced by the recompiled executable.
+    assert cache_file.read_bytes() != b"not an executable"
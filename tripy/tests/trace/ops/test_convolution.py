@@ -26,3 +26,13 @@ class TestConvolution:
         output = conv_layer(input)
 
         assert output.trace_tensor.rank == input.rank
+
+    def test_window_parameters_are_tuples(self):
+        input = tp.ones((4, 3, 8, 8), dtype=tp.float32)
+        conv_layer = tp.Conv(3, 16, (5, 5), padding=[[1, 1], [2, 2]], stride=[1, 2], dtype=tp.float32)
+        conv = conv_layer(input).trace_tensor.producer
+
+        assert conv.padding == ((1, 1), (2, 2))
+        assert conv.stride == (1, 2)
+        assert conv.lhs_dilation is None
+        assert conv.rhs_dilation == (1, 1)
@@ -17,6 +17,8 @@
 
 import nvtripy as tp
 import pytest
+from nvtripy.flat_ir.ops import AbsOp, CosineOp, ExpOp, Expm1Op, Log1pOp, LogOp, RsqrtOp, SineOp, SqrtOp, TanhOp
+from nvtripy.trace.ops.unary_elementwise import _BUILDERS, _FLAT_IR_OP_TYPES, UnaryElementwise
 
 _UNARY_OPS = [
     tp.exp,
@@ -25,6 +27,8 @@ _UNARY_OPS = [
     tp.log,
     tp.sqrt,
     tp.abs,
+    tp.expm1,
+    tp.log1p,
 ]
 
 
@@ -34,3 +38,26 @@ class TestUnaryElementwise:
         a = tp.ones((2, 3))
         out = func(a)
         assert out.trace_tensor.rank == 2
+
+    @pytest.mark.parametrize(
+        "kind, OpType",
+        [
+            (UnaryElementwise.Kind.EXP, ExpOp),
+            (UnaryElementwise.Kind.TANH, TanhOp),
+            (UnaryElementwise.Kind.RSQRT, RsqrtOp),
+            (UnaryElementwise.Kind.LOG, LogOp),
+            (UnaryElementwise.Kind.SINE, SineOp),
+            (UnaryElementwise.Kind.COSINE, CosineOp),
+            (UnaryElementwise.Kind.SQRT, SqrtOp),
+            (UnaryElementwise.Kind.ABS, AbsOp),
+            (UnaryElementwise.Kind.EXPM1, Expm1Op),
+            (UnaryElementwise.Kind.LOG1P, Log1pOp),
+        ],
+    )
+    def test_flat_ir_op_type(self, kind, OpType):
+        assert _FLAT_IR_OP_TYPES[kind] is OpType
+        assert _BUILDERS[kind] == OpType.build
+
+    def test_kind_str(self):
+        out = tp.exp(tp.ones((2, 3)))
+        assert "kind=Kind.EXP" in str(out.trace_tensor.producer)
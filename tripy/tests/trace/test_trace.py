@@ -22,6 +22,7 @@ import cupy as cp
 import nvtripy as tp
 from tests import helper
 from nvtripy.constants import STORAGE_OP_CACHE_VOLUME_THRESHOLD
+from nvtripy.trace.ops.unary_elementwise import UnaryElementwise
 from nvtripy.trace.trace import Trace
 
 
@@ -82,6 +83,31 @@ class TestTrace:
         # Without duplication, we should just have [a, b, c, d].
         assert len(trace.ops) == 4
 
+    def test_duplicate_unary_ops_are_eliminated(self):
+        a = tp.ones((2, 3))
+
+        b = tp.exp(a)
+        c = tp.exp(a)
+        d = b + c
+
+        trace = Trace([d.trace_tensor])
+
+        # Only one of the two `exp` ops should remain, and `d` should consume its output twice.
+        assert len([op for op in trace.ops if isinstance(op, UnaryElementwise)]) == 1
+        assert trace.ops[-1].inputs[0] is trace.ops[-1].inputs[1]
+        # The frontend graph should not be modified.
+        assert d.trace_tensor.producer.inputs[1] is c.trace_tensor
+
+    def test_duplicate_unary_ops_producing_outputs_are_kept(self):
+        a = tp.ones((2, 3))
+
+        b = tp.exp(a)
+        c = tp.exp(a)
+
+        trace = Trace([b.trace_tensor, c.trace_tensor])
+
+        assert len([op for op in trace.ops if isinstance(op, UnaryElementwise)]) == 2
+
     def test_str(self):
         a = tp.Tensor([0], name="a")
         b = tp.Tensor([1], name="b")